@@ -10,14 +10,18 @@ Version: 1.0.0
 License: MIT
 """
 
-import json
+import sys
+import time
 import datetime
-from typing import List, Dict, Any, Optional, NamedTuple
+import collections.abc
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, NamedTuple, Mapping, Tuple, TextIO
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 
 
-class OwnershipParadigm(Enum):
+class OwnershipParadigm(StrEnum):
     """Types of intellectual ownership paradigms"""
     TRADITIONAL_INDIVIDUAL = "traditional_individual"
     COLLECTIVE_COMMONS = "collective_commons"
@@ -25,7 +29,7 @@ class OwnershipParadigm(Enum):
     HYBRID_MODEL = "hybrid_model"
 
 
-class StakeholderType(Enum):
+class StakeholderType(StrEnum):
     """Types of stakeholders in intellectual creation"""
     HUMAN_INDIVIDUAL = "human_individual"
     HUMAN_COLLECTIVE = "human_collective"
@@ -34,7 +38,13 @@ class StakeholderType(Enum):
     SOCIETAL = "societal"
 
 
-@dataclass
+# Human-readable stakeholder labels used in reports
+_STAKEHOLDER_DISPLAY = MappingProxyType({
+    s: s.value.replace('_', ' ').title() for s in StakeholderType
+})
+
+
+@dataclass(slots=True, frozen=True)
 class ContributionAnalysis:
     """Analysis of contributions from different stakeholders"""
     stakeholder_type: StakeholderType
@@ -47,12 +57,325 @@ class ContributionAnalysis:
 class OwnershipAnalysisResult(NamedTuple):
     """Result structure for ownership paradigm analysis"""
     scenario: str
-    traditional_model: Dict[str, Any]
-    ciop_model: Dict[str, Any]
+    traditional_model: Mapping[str, Any]
+    ciop_model: Mapping[str, Any]
     sustainability_score: float
-    implementation_challenges: List[str]
-    policy_recommendations: List[str]
-    stakeholder_impacts: List[ContributionAnalysis]
+    implementation_challenges: Tuple[str, ...]
+    policy_recommendations: Tuple[str, ...]
+    stakeholder_impacts: Tuple[ContributionAnalysis, ...]
+
+
+class _ReadOnlyMapping(collections.abc.Mapping):
+    """Immutable mapping for the static tables; pickles and copies as a rebuilt instance"""
+    __slots__ = ('_data',)
+    
+    def __init__(self, data: Mapping[str, Any]):
+        self._data = dict(data)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+    
+    def __reduce__(self):
+        return type(self), (dict(self._data),)
+
+
+# Static reference tables. These never depend on the analysed scenario, so they
+# are built once at import time and shared read-only across all instances.
+
+_TRADITIONAL_MODEL = _ReadOnlyMapping({
+    'paradigm': 'Individual Ownership',
+    'ownership_basis': 'Creator as sole owner',
+    'attribution': 'Single author/creator',
+    'economic_model': 'Exclusive rights and licensing',
+    'sustainability': 'Limited by individual capacity',
+    'collaboration': 'Restricted by ownership boundaries',
+    'ai_integration': 'Problematic - AI as tool vs. contributor',
+    'social_impact': 'Knowledge silos and access barriers'
+})
+
+_CIOP_MODEL = _ReadOnlyMapping({
+    'paradigm': 'Collective Stewardship',
+    'stewardship_basis': 'Responsible custodianship with attribution',
+    'attribution': 'Multi-agent contribution recognition',
+    'economic_model': 'Shared value creation and distribution',
+    'sustainability': 'Enhanced through collaborative evolution',
+    'collaboration': 'Enabled and incentivized',
+    'ai_integration': 'Recognized as collaborative partner',
+    'social_impact': 'Enhanced knowledge accessibility and innovation',
+    'governance': 'Stakeholder-inclusive decision making',
+    'adaptation': 'Dynamic framework responsive to technological change'
+})
+
+_CHALLENGES = (
+    "Legal framework adaptation - existing IP laws need modification",
+    "Stakeholder coordination - managing multiple interests and contributions",
+    "Attribution complexity - determining fair contribution weights",
+    "Economic transition - shifting from ownership to stewardship models",
+    "Cultural resistance - overcoming traditional ownership mindsets",
+    "International harmonization - coordinating across different legal systems",
+    "Technology integration - developing systems for multi-agent attribution",
+    "Conflict resolution - establishing mechanisms for disputes"
+)
+
+_RECOMMENDATIONS = (
+    "Establish pilot programs in academic institutions for CIOP testing",
+    "Develop legal templates for multi-stakeholder intellectual stewardship",
+    "Create tax incentives for organizations adopting CIOP frameworks",
+    "Implement mandatory AI contribution disclosure in relevant sectors",
+    "Establish international working groups for CIOP standardization",
+    "Develop education programs on intellectual stewardship principles",
+    "Create certification systems for CIOP-compliant organizations",
+    "Implement graduated transition periods for existing IP holders"
+)
+
+_CONTRIBUTIONS = (
+    # Human individual contribution
+    ContributionAnalysis(
+        stakeholder_type=StakeholderType.HUMAN_INDIVIDUAL,
+        contribution_weight=0.4,
+        contribution_description="Creative vision, domain expertise, judgment",
+        attribution_method="Primary creator recognition",
+        compensation_model="Base stewardship rights"
+    ),
+    # AI system contribution
+    ContributionAnalysis(
+        stakeholder_type=StakeholderType.AI_SYSTEM,
+        contribution_weight=0.3,
+        contribution_description="Computational processing, pattern recognition, optimization",
+        attribution_method="AI collaboration acknowledgment",
+        compensation_model="Technology provider compensation"
+    ),
+    # Collective knowledge contribution
+    ContributionAnalysis(
+        stakeholder_type=StakeholderType.HUMAN_COLLECTIVE,
+        contribution_weight=0.2,
+        contribution_description="Prior knowledge, cultural context, feedback",
+        attribution_method="Community contribution recognition",
+        compensation_model="Commons benefit sharing"
+    ),
+    # Institutional contribution
+    ContributionAnalysis(
+        stakeholder_type=StakeholderType.INSTITUTIONAL,
+        contribution_weight=0.1,
+        contribution_description="Infrastructure, resources, platform provision",
+        attribution_method="Institutional support acknowledgment",
+        compensation_model="Institutional benefit allocation"
+    )
+)
+
+
+def _format_contributions(contributions: Tuple[ContributionAnalysis, ...]) -> str:
+    """Render the stakeholder contribution report block"""
+    lines = ["\n👥 STAKEHOLDER CONTRIBUTION ANALYSIS", "-" * 50]
+    for i, contrib in enumerate(contributions, 1):
+        lines.append(f"   {i}. {_STAKEHOLDER_DISPLAY[contrib.stakeholder_type]}")
+        lines.append(f"      Weight: {contrib.contribution_weight:.1%}")
+        lines.append(f"      Description: {contrib.contribution_description}")
+        lines.append(f"      Attribution: {contrib.attribution_method}")
+        lines.append(f"      Compensation: {contrib.compensation_model}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+_CONTRIBUTIONS_REPORT = _format_contributions(_CONTRIBUTIONS)
+
+_PARADIGM_TEMPLATES = _ReadOnlyMapping({
+    'academic': _ReadOnlyMapping({
+        'focus': 'Knowledge sharing and collaborative research',
+        'stakeholders': ('researchers', 'institutions', 'students', 'ai_systems'),
+        'priorities': ('attribution', 'access', 'innovation')
+    }),
+    'corporate': _ReadOnlyMapping({
+        'focus': 'Innovation and competitive advantage',
+        'stakeholders': ('employees', 'companies', 'customers', 'ai_systems'),
+        'priorities': ('value_creation', 'attribution', 'sustainability')
+    }),
+    'legal': _ReadOnlyMapping({
+        'focus': 'Regulatory framework and compliance',
+        'stakeholders': ('lawmakers', 'courts', 'citizens', 'institutions'),
+        'priorities': ('fairness', 'enforceability', 'adaptation')
+    })
+})
+
+_POLICY_FRAMEWORKS = _ReadOnlyMapping({
+    'legislation': _ReadOnlyMapping({
+        'scope': 'National and international IP law reform',
+        'mechanisms': ('statutory_changes', 'treaty_modifications', 'regulatory_updates')
+    }),
+    'institutional': _ReadOnlyMapping({
+        'scope': 'Organizational policy development',
+        'mechanisms': ('internal_policies', 'certification_systems', 'best_practices')
+    }),
+    'economic': _ReadOnlyMapping({
+        'scope': 'Economic incentive structures',
+        'mechanisms': ('tax_policies', 'funding_models', 'market_mechanisms')
+    })
+})
+
+_DOMAIN_TEMPLATES = _ReadOnlyMapping({
+    'academic': _ReadOnlyMapping({
+        'stakeholders': ('faculty', 'students', 'administration', 'ai_systems'),
+        'priorities': ('knowledge_sharing', 'attribution', 'access'),
+        'constraints': ('academic_freedom', 'integrity_requirements')
+    }),
+    'corporate': _ReadOnlyMapping({
+        'stakeholders': ('employees', 'management', 'shareholders', 'customers'),
+        'priorities': ('innovation', 'competitiveness', 'value_creation'),
+        'constraints': ('profitability', 'regulatory_compliance')
+    }),
+    'legal': _ReadOnlyMapping({
+        'stakeholders': ('lawmakers', 'judiciary', 'legal_profession', 'citizens'),
+        'priorities': ('fairness', 'enforceability', 'consistency'),
+        'constraints': ('constitutional_limits', 'international_obligations')
+    })
+})
+
+_ACADEMIC_POLICY = _ReadOnlyMapping({
+    'title': 'Academic Intellectual Stewardship Policy',
+    'scope': 'University research and educational content creation',
+    'principles': (
+        'Collaborative attribution for all research outputs',
+        'AI contribution transparency and acknowledgment',
+        'Open access with proper stewardship attribution',
+        'Student-faculty-AI collaborative recognition'
+    ),
+    'implementation': (
+        'Mandatory CIOP training for all researchers',
+        'Updated publication and thesis guidelines',
+        'AI contribution disclosure requirements',
+        'Collaborative attribution tracking systems'
+    ),
+    'governance': 'Faculty senate and student representative oversight',
+    'enforcement': 'Academic integrity office with CIOP specialization'
+})
+
+_CORPORATE_POLICY = _ReadOnlyMapping({
+    'title': 'Corporate Intellectual Stewardship Framework',
+    'scope': 'Internal innovation and external collaboration',
+    'principles': (
+        'Multi-stakeholder contribution recognition',
+        'Sustainable innovation through shared stewardship',
+        'Fair value distribution among contributors',
+        'AI-human collaboration transparency'
+    ),
+    'implementation': (
+        'Employee stewardship agreements',
+        'AI contribution tracking systems',
+        'Cross-team collaboration incentives',
+        'External partner stewardship protocols'
+    ),
+    'governance': 'Innovation committee with legal and ethics representation',
+    'enforcement': 'HR policies with stewardship compliance metrics'
+})
+
+_LEGAL_POLICY = _ReadOnlyMapping({
+    'title': 'Intellectual Stewardship Legal Framework',
+    'scope': 'IP law modification for AI age',
+    'principles': (
+        'Multi-agent contribution legal recognition',
+        'Stewardship rights vs. ownership rights distinction',
+        'AI contribution legal status clarification',
+        'International harmonization of stewardship law'
+    ),
+    'implementation': (
+        'IP law amendment proposals',
+        'Court precedent development support',
+        'International treaty modification initiatives',
+        'Legal education curriculum updates'
+    ),
+    'governance': 'Multi-stakeholder legal reform commission',
+    'enforcement': 'Specialized IP courts with CIOP jurisdiction'
+})
+
+_GOVERNMENT_POLICY = _ReadOnlyMapping({
+    'title': 'National Intellectual Stewardship Strategy',
+    'scope': 'National knowledge economy transformation',
+    'principles': (
+        'Public interest in knowledge commons development',
+        'International competitiveness through collaboration',
+        'Citizen benefit from shared intellectual resources',
+        'Innovation incentives aligned with stewardship'
+    ),
+    'implementation': (
+        'National stewardship legislation',
+        'Public-private partnership frameworks',
+        'International cooperation agreements',
+        'Education system integration'
+    ),
+    'governance': 'Ministry of innovation with multi-stakeholder advisory board',
+    'enforcement': 'National intellectual stewardship agency'
+})
+
+_GENERAL_POLICY = _ReadOnlyMapping({
+    'title': 'General Intellectual Stewardship Framework',
+    'scope': 'Adaptable framework for various contexts',
+    'principles': (
+        'Stakeholder-inclusive decision making',
+        'Contribution-based attribution and compensation',
+        'Sustainable knowledge ecosystem development',
+        'Technology-adaptive governance structures'
+    ),
+    'implementation': (
+        'Context-specific policy development',
+        'Stakeholder engagement protocols',
+        'Attribution and compensation mechanisms',
+        'Continuous adaptation procedures'
+    ),
+    'governance': 'Context-appropriate multi-stakeholder governance',
+    'enforcement': 'Situation-specific compliance and dispute resolution'
+})
+
+
+# Simplified CIOP sustainability score: base 0.7, +0.1 enhanced collaboration,
+# +0.1 innovation potential, +0.05 knowledge access, -0.05 implementation complexity
+_SUSTAINABILITY_SCORE = 0.9
+
+# Default cap on retained analyses per framework instance
+_DEFAULT_HISTORY_LIMIT = 1000
+
+# Default number of distinct (scenario, context) results kept per framework instance
+_DEFAULT_CACHE_SIZE = 128
+
+
+def _fmt_ts(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as a local ISO 8601 string"""
+    seconds, remainder_ns = divmod(timestamp_ns, 10**9)
+    return datetime.datetime.fromtimestamp(seconds).replace(microsecond=remainder_ns // 1000).isoformat()
+
+
+def _write_lines(out: Optional[TextIO], lines: List[str]) -> None:
+    """Write a block of report lines with a single call (stdout by default)"""
+    (out if out is not None else sys.stdout).write("\n".join(lines) + "\n")
+
+
+def _format_policy_block(policy: Mapping[str, Any]) -> str:
+    """Render a policy mapping as its report block"""
+    lines = []
+    for key, value in policy.items():
+        lines.append(f"\n📋 {key.upper()}:")
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                lines.append(f"   • {item}")
+        else:
+            lines.append(f"   {value}")
+    return "\n".join(lines)
+
+
+# id(policy) -> rendered report block for the static domain policies
+_POLICY_BLOCKS = MappingProxyType({
+    id(policy): _format_policy_block(policy)
+    for policy in (_ACADEMIC_POLICY, _CORPORATE_POLICY, _LEGAL_POLICY,
+                   _GOVERNMENT_POLICY, _GENERAL_POLICY)
+})
 
 
 class IntellectualStewardshipFramework:
@@ -61,10 +384,21 @@ class IntellectualStewardshipFramework:
     Provides tools for analyzing ownership scenarios and generating stewardship models.
     """
     
-    def __init__(self):
-        self.analysis_history = []
-        self.paradigm_templates = self._initialize_paradigm_templates()
-        self.policy_frameworks = self._initialize_policy_frameworks()
+    def __init__(self, verbose: bool = True, out: Optional[TextIO] = None,
+                 history_limit: Optional[int] = _DEFAULT_HISTORY_LIMIT,
+                 cache_size: Optional[int] = _DEFAULT_CACHE_SIZE):
+        # (timestamp_ns, context, result) entries; oldest are dropped past history_limit
+        self.analysis_history = deque(maxlen=history_limit)
+        # LRU of (scenario, context) -> result; like history_limit, None means
+        # unbounded, and a cache_size of 0 disables caching
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("cache_size must be a non-negative integer or None")
+        self._analysis_cache: OrderedDict[Tuple[str, str], OwnershipAnalysisResult] = OrderedDict()
+        self._cache_size = cache_size
+        self.paradigm_templates = _PARADIGM_TEMPLATES
+        self.policy_frameworks = _POLICY_FRAMEWORKS
+        self.verbose = verbose
+        self.out = out
     
     def analyze_ownership_paradigm(self, scenario: str, context: str = "general") -> OwnershipAnalysisResult:
         """
@@ -76,12 +410,38 @@ class IntellectualStewardshipFramework:
             
         Returns:
             OwnershipAnalysisResult containing comparative analysis and recommendations
+            
+        Repeated calls with the same scenario and context return the cached
+        result and only display the results summary.
         """
-        print(f"🏛️ COMPREHENSIVE INTELLECTUAL OWNERSHIP PARADIGM ANALYSIS")
-        print(f"Scenario: {scenario}")
-        print(f"Context: {context.upper()}")
-        print("=" * 80)
+        if self.verbose:
+            _write_lines(self.out, [
+                "🏛️ COMPREHENSIVE INTELLECTUAL OWNERSHIP PARADIGM ANALYSIS",
+                f"Scenario: {scenario}",
+                f"Context: {context.upper()}",
+                "=" * 80
+            ])
+        
+        key = (scenario, context)
+        result = self._analysis_cache.get(key)
+        if result is not None:
+            self._analysis_cache.move_to_end(key)
+        else:
+            result = self._run_analysis(scenario, context)
+            if self._cache_size != 0:
+                self._analysis_cache[key] = result
+                if self._cache_size is not None and len(self._analysis_cache) > self._cache_size:
+                    self._analysis_cache.popitem(last=False)
         
+        # Store in analysis history
+        self.analysis_history.append((time.time_ns(), context, result))
+        
+        if self.verbose:
+            self._display_analysis_results(result)
+        return result
+    
+    def _run_analysis(self, scenario: str, context: str) -> OwnershipAnalysisResult:
+        """Run every analysis stage for a scenario not found in the cache"""
         # Analyze traditional ownership model
         traditional_model = self._analyze_traditional_model(scenario, context)
         
@@ -109,225 +469,90 @@ class IntellectualStewardshipFramework:
             policy_recommendations=recommendations,
             stakeholder_impacts=stakeholder_impacts
         )
-        
-        # Store in analysis history
-        self.analysis_history.append({
-            'timestamp': datetime.datetime.now().isoformat(),
-            'context': context,
-            'result': result._asdict()
-        })
-        
-        self._display_analysis_results(result)
         return result
     
-    def _analyze_traditional_model(self, scenario: str, context: str) -> Dict[str, Any]:
+    def history_as_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize the analysis history as plain dictionaries"""
+        return [
+            {'timestamp': _fmt_ts(timestamp_ns), 'context': context, 'result': result._asdict()}
+            for timestamp_ns, context, result in self.analysis_history
+        ]
+    
+    def _analyze_traditional_model(self, scenario: str, context: str) -> Mapping[str, Any]:
         """Analyze traditional individual ownership model"""
-        print(f"\n📊 TRADITIONAL OWNERSHIP MODEL ANALYSIS")
-        print("-" * 50)
-        
-        model = {
-            'paradigm': 'Individual Ownership',
-            'ownership_basis': 'Creator as sole owner',
-            'attribution': 'Single author/creator',
-            'economic_model': 'Exclusive rights and licensing',
-            'sustainability': 'Limited by individual capacity',
-            'collaboration': 'Restricted by ownership boundaries',
-            'ai_integration': 'Problematic - AI as tool vs. contributor',
-            'social_impact': 'Knowledge silos and access barriers'
-        }
-        
-        print(f"   📋 Paradigm: {model['paradigm']}")
-        print(f"   🎯 Ownership Basis: {model['ownership_basis']}")
-        print(f"   📝 Attribution: {model['attribution']}")
-        print(f"   💰 Economic Model: {model['economic_model']}")
-        print(f"   ⚠️ AI Integration Issues: {model['ai_integration']}")
+        model = _TRADITIONAL_MODEL
+        
+        if self.verbose:
+            _write_lines(self.out, [
+                "\n📊 TRADITIONAL OWNERSHIP MODEL ANALYSIS",
+                "-" * 50,
+                f"   📋 Paradigm: {model['paradigm']}",
+                f"   🎯 Ownership Basis: {model['ownership_basis']}",
+                f"   📝 Attribution: {model['attribution']}",
+                f"   💰 Economic Model: {model['economic_model']}",
+                f"   ⚠️ AI Integration Issues: {model['ai_integration']}"
+            ])
         
         return model
     
-    def _generate_ciop_model(self, scenario: str, context: str) -> Dict[str, Any]:
+    def _generate_ciop_model(self, scenario: str, context: str) -> Mapping[str, Any]:
         """Generate CIOP stewardship model"""
-        print(f"\n🌟 CIOP STEWARDSHIP MODEL")
-        print("-" * 50)
-        
-        model = {
-            'paradigm': 'Collective Stewardship',
-            'stewardship_basis': 'Responsible custodianship with attribution',
-            'attribution': 'Multi-agent contribution recognition',
-            'economic_model': 'Shared value creation and distribution',
-            'sustainability': 'Enhanced through collaborative evolution',
-            'collaboration': 'Enabled and incentivized',
-            'ai_integration': 'Recognized as collaborative partner',
-            'social_impact': 'Enhanced knowledge accessibility and innovation',
-            'governance': 'Stakeholder-inclusive decision making',
-            'adaptation': 'Dynamic framework responsive to technological change'
-        }
-        
-        print(f"   🌟 Paradigm: {model['paradigm']}")
-        print(f"   🎯 Stewardship Basis: {model['stewardship_basis']}")
-        print(f"   📝 Attribution: {model['attribution']}")
-        print(f"   💰 Economic Model: {model['economic_model']}")
-        print(f"   🤖 AI Integration: {model['ai_integration']}")
-        print(f"   🌍 Social Impact: {model['social_impact']}")
+        model = _CIOP_MODEL
+        
+        if self.verbose:
+            _write_lines(self.out, [
+                "\n🌟 CIOP STEWARDSHIP MODEL",
+                "-" * 50,
+                f"   🌟 Paradigm: {model['paradigm']}",
+                f"   🎯 Stewardship Basis: {model['stewardship_basis']}",
+                f"   📝 Attribution: {model['attribution']}",
+                f"   💰 Economic Model: {model['economic_model']}",
+                f"   🤖 AI Integration: {model['ai_integration']}",
+                f"   🌍 Social Impact: {model['social_impact']}"
+            ])
         
         return model
     
-    def _analyze_stakeholder_contributions(self, scenario: str) -> List[ContributionAnalysis]:
+    def _analyze_stakeholder_contributions(self, scenario: str) -> Tuple[ContributionAnalysis, ...]:
         """Analyze contributions from different stakeholders"""
-        print(f"\n👥 STAKEHOLDER CONTRIBUTION ANALYSIS")
-        print("-" * 50)
-        
-        contributions = []
+        contributions = _CONTRIBUTIONS
         
-        # Human individual contribution
-        human_contrib = ContributionAnalysis(
-            stakeholder_type=StakeholderType.HUMAN_INDIVIDUAL,
-            contribution_weight=0.4,
-            contribution_description="Creative vision, domain expertise, judgment",
-            attribution_method="Primary creator recognition",
-            compensation_model="Base stewardship rights"
-        )
-        contributions.append(human_contrib)
-        
-        # AI system contribution
-        ai_contrib = ContributionAnalysis(
-            stakeholder_type=StakeholderType.AI_SYSTEM,
-            contribution_weight=0.3,
-            contribution_description="Computational processing, pattern recognition, optimization",
-            attribution_method="AI collaboration acknowledgment",
-            compensation_model="Technology provider compensation"
-        )
-        contributions.append(ai_contrib)
-        
-        # Collective knowledge contribution
-        collective_contrib = ContributionAnalysis(
-            stakeholder_type=StakeholderType.HUMAN_COLLECTIVE,
-            contribution_weight=0.2,
-            contribution_description="Prior knowledge, cultural context, feedback",
-            attribution_method="Community contribution recognition",
-            compensation_model="Commons benefit sharing"
-        )
-        contributions.append(collective_contrib)
-        
-        # Institutional contribution
-        institutional_contrib = ContributionAnalysis(
-            stakeholder_type=StakeholderType.INSTITUTIONAL,
-            contribution_weight=0.1,
-            contribution_description="Infrastructure, resources, platform provision",
-            attribution_method="Institutional support acknowledgment",
-            compensation_model="Institutional benefit allocation"
-        )
-        contributions.append(institutional_contrib)
-        
-        for i, contrib in enumerate(contributions, 1):
-            print(f"   {i}. {contrib.stakeholder_type.value.replace('_', ' ').title()}")
-            print(f"      Weight: {contrib.contribution_weight:.1%}")
-            print(f"      Description: {contrib.contribution_description}")
-            print(f"      Attribution: {contrib.attribution_method}")
-            print(f"      Compensation: {contrib.compensation_model}")
-            print()
+        if self.verbose:
+            _write_lines(self.out, [_CONTRIBUTIONS_REPORT])
         
         return contributions
     
-    def _calculate_sustainability_score(self, scenario: str, ciop_model: Dict[str, Any]) -> float:
+    def _calculate_sustainability_score(self, scenario: str, ciop_model: Mapping[str, Any]) -> float:
         """Calculate sustainability score for CIOP implementation"""
-        # Simplified scoring based on multiple factors
-        base_score = 0.7
-        
-        # Factors that increase sustainability
-        collaboration_factor = 0.1  # Enhanced collaboration
-        innovation_factor = 0.1     # Increased innovation potential
-        access_factor = 0.05        # Improved knowledge access
-        
-        # Factors that may decrease sustainability
-        complexity_factor = -0.05   # Implementation complexity
-        
-        score = base_score + collaboration_factor + innovation_factor + access_factor + complexity_factor
-        return min(max(score, 0.0), 1.0)
+        return _SUSTAINABILITY_SCORE
     
-    def _identify_implementation_challenges(self, scenario: str, context: str) -> List[str]:
+    def _identify_implementation_challenges(self, scenario: str, context: str) -> Tuple[str, ...]:
         """Identify key challenges for CIOP implementation"""
-        challenges = [
-            "Legal framework adaptation - existing IP laws need modification",
-            "Stakeholder coordination - managing multiple interests and contributions",
-            "Attribution complexity - determining fair contribution weights",
-            "Economic transition - shifting from ownership to stewardship models",
-            "Cultural resistance - overcoming traditional ownership mindsets",
-            "International harmonization - coordinating across different legal systems",
-            "Technology integration - developing systems for multi-agent attribution",
-            "Conflict resolution - establishing mechanisms for disputes"
-        ]
-        return challenges
+        return _CHALLENGES
     
-    def _generate_policy_recommendations(self, scenario: str, context: str, ciop_model: Dict[str, Any]) -> List[str]:
+    def _generate_policy_recommendations(self, scenario: str, context: str, ciop_model: Mapping[str, Any]) -> Tuple[str, ...]:
         """Generate specific policy recommendations for CIOP implementation"""
-        recommendations = [
-            "Establish pilot programs in academic institutions for CIOP testing",
-            "Develop legal templates for multi-stakeholder intellectual stewardship",
-            "Create tax incentives for organizations adopting CIOP frameworks",
-            "Implement mandatory AI contribution disclosure in relevant sectors",
-            "Establish international working groups for CIOP standardization",
-            "Develop education programs on intellectual stewardship principles",
-            "Create certification systems for CIOP-compliant organizations",
-            "Implement graduated transition periods for existing IP holders"
-        ]
-        return recommendations
+        return _RECOMMENDATIONS
     
     def _display_analysis_results(self, result: OwnershipAnalysisResult):
         """Display formatted results of ownership paradigm analysis"""
-        print(f"\n📋 OWNERSHIP PARADIGM ANALYSIS RESULTS")
-        print("=" * 60)
-        print(f"🎯 Scenario: {result.scenario}")
-        
-        print(f"\n⚖️ PARADIGM COMPARISON:")
-        print(f"   Traditional: {result.traditional_model['paradigm']}")
-        print(f"   CIOP: {result.ciop_model['paradigm']}")
-        
-        print(f"\n📊 SUSTAINABILITY SCORE: {result.sustainability_score:.2%}")
-        
-        print(f"\n⚠️ IMPLEMENTATION CHALLENGES:")
+        lines = [
+            "\n📋 OWNERSHIP PARADIGM ANALYSIS RESULTS",
+            "=" * 60,
+            f"🎯 Scenario: {result.scenario}",
+            "\n⚖️ PARADIGM COMPARISON:",
+            f"   Traditional: {result.traditional_model['paradigm']}",
+            f"   CIOP: {result.ciop_model['paradigm']}",
+            f"\n📊 SUSTAINABILITY SCORE: {result.sustainability_score:.2%}",
+            "\n⚠️ IMPLEMENTATION CHALLENGES:"
+        ]
         for i, challenge in enumerate(result.implementation_challenges[:5], 1):
-            print(f"   {i}. {challenge}")
+            lines.append(f"   {i}. {challenge}")
         
-        print(f"\n💡 KEY POLICY RECOMMENDATIONS:")
+        lines.append("\n💡 KEY POLICY RECOMMENDATIONS:")
         for i, rec in enumerate(result.policy_recommendations[:5], 1):
-            print(f"   {i}. {rec}")
-    
-    def _initialize_paradigm_templates(self) -> Dict[str, Any]:
-        """Initialize paradigm templates for different contexts"""
-        return {
-            'academic': {
-                'focus': 'Knowledge sharing and collaborative research',
-                'stakeholders': ['researchers', 'institutions', 'students', 'ai_systems'],
-                'priorities': ['attribution', 'access', 'innovation']
-            },
-            'corporate': {
-                'focus': 'Innovation and competitive advantage',
-                'stakeholders': ['employees', 'companies', 'customers', 'ai_systems'],
-                'priorities': ['value_creation', 'attribution', 'sustainability']
-            },
-            'legal': {
-                'focus': 'Regulatory framework and compliance',
-                'stakeholders': ['lawmakers', 'courts', 'citizens', 'institutions'],
-                'priorities': ['fairness', 'enforceability', 'adaptation']
-            }
-        }
-    
-    def _initialize_policy_frameworks(self) -> Dict[str, Any]:
-        """Initialize policy framework templates"""
-        return {
-            'legislation': {
-                'scope': 'National and international IP law reform',
-                'mechanisms': ['statutory_changes', 'treaty_modifications', 'regulatory_updates']
-            },
-            'institutional': {
-                'scope': 'Organizational policy development',
-                'mechanisms': ['internal_policies', 'certification_systems', 'best_practices']
-            },
-            'economic': {
-                'scope': 'Economic incentive structures',
-                'mechanisms': ['tax_policies', 'funding_models', 'market_mechanisms']
-            }
-        }
+            lines.append(f"   {i}. {rec}")
+        _write_lines(self.out, lines)
 
 
 class CIOPPolicyGenerator:
@@ -335,201 +560,60 @@ class CIOPPolicyGenerator:
     Generator for specific CIOP policy implementations across different domains.
     """
     
-    def __init__(self):
-        self.domain_templates = self._initialize_domain_templates()
+    def __init__(self, verbose: bool = True, out: Optional[TextIO] = None):
+        self.domain_templates = _DOMAIN_TEMPLATES
+        self.verbose = verbose
+        self.out = out
+        # Domain name (lower-cased) -> bound policy generator; unknown domains
+        # fall back to the general template.
+        self._policy_dispatch = {
+            'academic': self._generate_academic_policy,
+            'corporate': self._generate_corporate_policy,
+            'legal': self._generate_legal_policy,
+            'government': self._generate_government_policy
+        }
     
-    def generate_domain_policy(self, domain: str, scenario: str) -> Dict[str, Any]:
+    def generate_domain_policy(self, domain: str, scenario: str) -> Mapping[str, Any]:
         """Generate domain-specific CIOP policy framework"""
-        print(f"\n📜 CIOP POLICY FRAMEWORK GENERATION")
-        print(f"Domain: {domain.upper()}")
-        print(f"Scenario: {scenario}")
-        print("=" * 60)
-        
-        if domain.lower() == 'academic':
-            return self._generate_academic_policy(scenario)
-        elif domain.lower() == 'corporate':
-            return self._generate_corporate_policy(scenario)
-        elif domain.lower() == 'legal':
-            return self._generate_legal_policy(scenario)
-        elif domain.lower() == 'government':
-            return self._generate_government_policy(scenario)
-        else:
-            return self._generate_general_policy(scenario)
+        if self.verbose:
+            _write_lines(self.out, [
+                "\n📜 CIOP POLICY FRAMEWORK GENERATION",
+                f"Domain: {domain.upper()}",
+                f"Scenario: {scenario}",
+                "=" * 60
+            ])
+        
+        generator = self._policy_dispatch.get(domain.lower(), self._generate_general_policy)
+        return generator(scenario)
     
-    def _generate_academic_policy(self, scenario: str) -> Dict[str, Any]:
+    def _generate_academic_policy(self, scenario: str) -> Mapping[str, Any]:
         """Generate academic institution CIOP policy"""
-        policy = {
-            'title': 'Academic Intellectual Stewardship Policy',
-            'scope': 'University research and educational content creation',
-            'principles': [
-                'Collaborative attribution for all research outputs',
-                'AI contribution transparency and acknowledgment',
-                'Open access with proper stewardship attribution',
-                'Student-faculty-AI collaborative recognition'
-            ],
-            'implementation': [
-                'Mandatory CIOP training for all researchers',
-                'Updated publication and thesis guidelines',
-                'AI contribution disclosure requirements',
-                'Collaborative attribution tracking systems'
-            ],
-            'governance': 'Faculty senate and student representative oversight',
-            'enforcement': 'Academic integrity office with CIOP specialization'
-        }
-        
-        for key, value in policy.items():
-            print(f"\n📋 {key.upper()}:")
-            if isinstance(value, list):
-                for item in value:
-                    print(f"   • {item}")
-            else:
-                print(f"   {value}")
-        
-        return policy
+        return self._emit_policy(_ACADEMIC_POLICY)
     
-    def _generate_corporate_policy(self, scenario: str) -> Dict[str, Any]:
+    def _generate_corporate_policy(self, scenario: str) -> Mapping[str, Any]:
         """Generate corporate CIOP policy"""
-        policy = {
-            'title': 'Corporate Intellectual Stewardship Framework',
-            'scope': 'Internal innovation and external collaboration',
-            'principles': [
-                'Multi-stakeholder contribution recognition',
-                'Sustainable innovation through shared stewardship',
-                'Fair value distribution among contributors',
-                'AI-human collaboration transparency'
-            ],
-            'implementation': [
-                'Employee stewardship agreements',
-                'AI contribution tracking systems',
-                'Cross-team collaboration incentives',
-                'External partner stewardship protocols'
-            ],
-            'governance': 'Innovation committee with legal and ethics representation',
-            'enforcement': 'HR policies with stewardship compliance metrics'
-        }
-        
-        for key, value in policy.items():
-            print(f"\n📋 {key.upper()}:")
-            if isinstance(value, list):
-                for item in value:
-                    print(f"   • {item}")
-            else:
-                print(f"   {value}")
-        
-        return policy
+        return self._emit_policy(_CORPORATE_POLICY)
     
-    def _generate_legal_policy(self, scenario: str) -> Dict[str, Any]:
+    def _generate_legal_policy(self, scenario: str) -> Mapping[str, Any]:
         """Generate legal framework CIOP policy"""
-        policy = {
-            'title': 'Intellectual Stewardship Legal Framework',
-            'scope': 'IP law modification for AI age',
-            'principles': [
-                'Multi-agent contribution legal recognition',
-                'Stewardship rights vs. ownership rights distinction',
-                'AI contribution legal status clarification',
-                'International harmonization of stewardship law'
-            ],
-            'implementation': [
-                'IP law amendment proposals',
-                'Court precedent development support',
-                'International treaty modification initiatives',
-                'Legal education curriculum updates'
-            ],
-            'governance': 'Multi-stakeholder legal reform commission',
-            'enforcement': 'Specialized IP courts with CIOP jurisdiction'
-        }
-        
-        for key, value in policy.items():
-            print(f"\n📋 {key.upper()}:")
-            if isinstance(value, list):
-                for item in value:
-                    print(f"   • {item}")
-            else:
-                print(f"   {value}")
-        
-        return policy
+        return self._emit_policy(_LEGAL_POLICY)
     
-    def _generate_government_policy(self, scenario: str) -> Dict[str, Any]:
+    def _generate_government_policy(self, scenario: str) -> Mapping[str, Any]:
         """Generate government CIOP policy"""
-        policy = {
-            'title': 'National Intellectual Stewardship Strategy',
-            'scope': 'National knowledge economy transformation',
-            'principles': [
-                'Public interest in knowledge commons development',
-                'International competitiveness through collaboration',
-                'Citizen benefit from shared intellectual resources',
-                'Innovation incentives aligned with stewardship'
-            ],
-            'implementation': [
-                'National stewardship legislation',
-                'Public-private partnership frameworks',
-                'International cooperation agreements',
-                'Education system integration'
-            ],
-            'governance': 'Ministry of innovation with multi-stakeholder advisory board',
-            'enforcement': 'National intellectual stewardship agency'
-        }
-        
-        for key, value in policy.items():
-            print(f"\n📋 {key.upper()}:")
-            if isinstance(value, list):
-                for item in value:
-                    print(f"   • {item}")
-            else:
-                print(f"   {value}")
-        
-        return policy
+        return self._emit_policy(_GOVERNMENT_POLICY)
     
-    def _generate_general_policy(self, scenario: str) -> Dict[str, Any]:
+    def _generate_general_policy(self, scenario: str) -> Mapping[str, Any]:
         """Generate general CIOP policy template"""
-        policy = {
-            'title': 'General Intellectual Stewardship Framework',
-            'scope': 'Adaptable framework for various contexts',
-            'principles': [
-                'Stakeholder-inclusive decision making',
-                'Contribution-based attribution and compensation',
-                'Sustainable knowledge ecosystem development',
-                'Technology-adaptive governance structures'
-            ],
-            'implementation': [
-                'Context-specific policy development',
-                'Stakeholder engagement protocols',
-                'Attribution and compensation mechanisms',
-                'Continuous adaptation procedures'
-            ],
-            'governance': 'Context-appropriate multi-stakeholder governance',
-            'enforcement': 'Situation-specific compliance and dispute resolution'
-        }
-        
-        for key, value in policy.items():
-            print(f"\n📋 {key.upper()}:")
-            if isinstance(value, list):
-                for item in value:
-                    print(f"   • {item}")
-            else:
-                print(f"   {value}")
-        
-        return policy
+        return self._emit_policy(_GENERAL_POLICY)
     
-    def _initialize_domain_templates(self) -> Dict[str, Any]:
-        """Initialize domain-specific policy templates"""
-        return {
-            'academic': {
-                'stakeholders': ['faculty', 'students', 'administration', 'ai_systems'],
-                'priorities': ['knowledge_sharing', 'attribution', 'access'],
-                'constraints': ['academic_freedom', 'integrity_requirements']
-            },
-            'corporate': {
-                'stakeholders': ['employees', 'management', 'shareholders', 'customers'],
-                'priorities': ['innovation', 'competitiveness', 'value_creation'],
-                'constraints': ['profitability', 'regulatory_compliance']
-            },
-            'legal': {
-                'stakeholders': ['lawmakers', 'judiciary', 'legal_profession', 'citizens'],
-                'priorities': ['fairness', 'enforceability', 'consistency'],
-                'constraints': ['constitutional_limits', 'international_obligations']
-            }
-        }
+    def _emit_policy(self, policy: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Write the report block for a policy when verbose and return the policy"""
+        if self.verbose:
+            block = _POLICY_BLOCKS.get(id(policy))
+            if block is None:
+                block = _format_policy_block(policy)
+            _write_lines(self.out, [block])
+        return policy
 
 
 def demonstrate_ciop_applications():